@@ -1,9 +1,160 @@
-import requests
+import functools
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import time
+import types
 import yaml
 import click
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+if TYPE_CHECKING:
+    # requests is imported lazily so --help and argument parsing stay fast
+    import requests
+
+# Prefer the libyaml-backed loader when available; same semantics as SafeLoader
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# (connect, read) timeout in seconds applied to every remote validation request
+_HTTP_TIMEOUT = (3, 10)
+# Tighter timeout for the API server health check, normally on the local network
+_API_HEALTH_TIMEOUT = (2, 5)
+# Deploy requests may take a while server-side, so allow a longer read
+_DEPLOY_TIMEOUT = (_API_HEALTH_TIMEOUT[0], 60)
+
+# Shared session so probes reuse pooled keep-alive connections; see _get_session
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+# Validated configs are cached on disk and reused while fresh
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "tokenvisor")
+_CACHE_TTL = 300  # seconds
+_CACHED_VALIDATION_NOTE = "(using cached validation, pass --no-cache to re-check)"
+
+# Sentinel for fields absent from a config section
+_MISSING = object()
+
+# Required fields per config section
+_REQUIRED_ENV_FIELDS = ("VLLM_USE_TRITON_FLASH_ATTN", "VLLM_ROCM_USE_AITER")
+_REQUIRED_RESOURCES_FIELDS = ("cpus", "memory", "ports", "accelerators", "image_id")
+_REQUIRED_SERVICE_FIELDS = ("ports", "readiness_probe")
+
+# Accelerator spec, e.g. MI200:2; the count accepts what int() does
+_ACCELERATORS_RE = re.compile(r"[^:]*:\s*[+-]?\d+(?:_\d+)*\s*")
+
+# Expected types of optional environment variables
+_VALID_ENV_TYPES = types.MappingProxyType(
+    {
+        "VLLM_ROCM_USE_AITER_LINEAR": bool,
+        "VLLM_ROCM_USE_AITER_MOE": bool,
+        "VLLM_ROCM_USE_AITER_FP8_BLOCK_SCALED_MOE": bool,
+        "VLLM_ROCM_USE_AITER_RMSNORM": bool,
+        "VLLM_WORKER_MULTIPROC_METHOD": str,
+        "VLLM_IMAGE_FETCH_TIMEOUT": int,
+        "VLLM_VIDEO_FETCH_TIMEOUT": int,
+        "VLLM_AUDIO_FETCH_TIMEOUT": int,
+        "VLLM_RPC_TIMEOUT": int,
+    }
+)
+
+# Successful remote probe responses are memoized per (method, url) for the life
+# of the process
+try:
+    _PROBE_CACHE_TTL = float(os.environ.get("TOKENVISOR_PROBE_CACHE_TTL", "60"))
+except ValueError:
+    _PROBE_CACHE_TTL = 60.0
+_probe_cache: Dict[Tuple[str, str], Tuple[float, "requests.Response"]] = {}
+_probe_cache_lock = threading.Lock()
+
+
+def _has_non_finite_float(obj: Any) -> bool:
+    """Check whether an object contains NaN or infinite floats."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite_float(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite_float(v) for v in obj)
+    return False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize an object to strict JSON bytes, using orjson when available."""
+    if orjson is not None:
+        # orjson silently writes NaN/Infinity as null; reject them like json does
+        if _has_non_finite_float(obj):
+            raise ValueError("Out of range float values are not JSON compliant")
+        try:
+            # Passing dates through makes them fail here, as they do with json
+            return orjson.dumps(
+                obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            )
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits or dates; defer to the stdlib encoder
+            pass
+    return json.dumps(obj, allow_nan=False).encode("utf-8")
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _get_session() -> "requests.Session":
+    """Get the shared HTTP session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # Retry a failed connect once, never a read, so dead hosts fail fast
+            retry = Retry(total=1, connect=1, read=0, backoff_factor=0.1)
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _cached_request(method: str, url: str, **kwargs: Any) -> "requests.Response":
+    """Send a probe request, reusing a recent response for the same method and URL.
+
+    The cache key is (method, url) only; other keyword arguments such as
+    timeout or allow_redirects are not part of it. Only 200 responses are
+    cached so transient failures are retried on the next call.
+    """
+    key = (method, url)
+    with _probe_cache_lock:
+        cached = _probe_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < _PROBE_CACHE_TTL:
+        return cached[1]
+
+    response = _get_session().request(method, url, **kwargs)
+    if response.status_code == 200:
+        now = time.monotonic()
+        with _probe_cache_lock:
+            for stale_key in [
+                k for k, (ts, _) in _probe_cache.items() if now - ts >= _PROBE_CACHE_TTL
+            ]:
+                del _probe_cache[stale_key]
+            _probe_cache[key] = (now, response)
+    return response
+
 
 @dataclass
 class APIConfig:
@@ -49,33 +200,142 @@ class ResourceConfig:
 
 
 class ConfigReader:
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, use_cache: bool = True):
         self.config_path = config_path
-        self.config = self._load_config()
-
-    def _load_config(self) -> Dict[str, Any]:
-        """Load and parse the YAML configuration file."""
+        self.use_cache = use_cache
+        self._cache_key_value: Optional[Dict[str, Any]] = None
+        self._validated = False
+        # True when the config came from the validated-config cache
+        self.from_cache = False
+
+    @functools.cached_property
+    def config(self) -> Dict[str, Any]:
+        """Load and parse the YAML configuration file without validating it."""
         try:
-            with open(self.config_path, "r") as file:
-                config = yaml.safe_load(file)
-
-                if config is None:
-                    raise click.ClickException(
-                        f"Configuration file is empty: {self.config_path}"
-                    )
-
-                if not isinstance(config, dict):
-                    raise click.ClickException(
-                        f"Invalid YAML format in {self.config_path}. Expected a dictionary."
-                    )
-
-                self._validate_config(config)
-                return config
+            # Binary mode lets the C loader do the UTF-8 decoding itself
+            with open(self.config_path, "rb") as file:
+                if self.use_cache:
+                    raw = file.read()
+                    self._cache_key_value = self._cache_key(raw)
+                    cached = self._read_cache(self._cache_key_value)
+                    if cached is not None:
+                        # Cache only holds configs that already passed validation
+                        self._validated = True
+                        self.from_cache = True
+                        return cached
+                    config = yaml.load(raw, Loader=_YAML_LOADER)
+                else:
+                    # No hash needed, so stream the file straight into the loader
+                    config = yaml.load(file, Loader=_YAML_LOADER)
         except FileNotFoundError:
             raise click.ClickException(f"Config file not found: {self.config_path}")
         except yaml.YAMLError as e:
             raise click.ClickException(f"Error parsing YAML file: {e}")
 
+        if config is None:
+            raise click.ClickException(
+                f"Configuration file is empty: {self.config_path}"
+            )
+
+        if not isinstance(config, dict):
+            raise click.ClickException(
+                f"Invalid YAML format in {self.config_path}. Expected a dictionary."
+            )
+
+        return config
+
+    def validate(self) -> None:
+        """Validate the configuration, including the remote checks."""
+        config = self.config
+        if self._validated:
+            return
+
+        self._validate_config(config)
+        self._validated = True
+        # Only cache configs that passed validation
+        if self._cache_key_value is not None:
+            self._write_cache(self._cache_key_value, config)
+
+    def _cache_key(self, raw: bytes) -> Dict[str, Any]:
+        """Build the cache key identifying this exact version of the config file."""
+        return {
+            "path": os.path.abspath(self.config_path),
+            "mtime_ns": os.stat(self.config_path).st_mtime_ns,
+            "sha256": hashlib.sha256(raw).hexdigest(),
+        }
+
+    def _cache_file(self, cache_key: Dict[str, Any]) -> str:
+        """Get the cache file path for a cache key."""
+        # Hash the whole key so identical files at different paths don't collide
+        key_bytes = json.dumps(cache_key, sort_keys=True).encode("utf-8")
+        return os.path.join(_CACHE_DIR, f"{hashlib.sha256(key_bytes).hexdigest()}.json")
+
+    def _read_cache(self, cache_key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Return the cached validated config, or None if missing or stale."""
+        cache_file = self._cache_file(cache_key)
+        try:
+            with open(cache_file, "r") as file:
+                entry = json.load(file)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            entry = None
+
+        if isinstance(entry, dict) and entry.get("key") == cache_key:
+            validated_at = entry.get("validated_at")
+            config = entry.get("config")
+            if (
+                isinstance(validated_at, (int, float))
+                and not isinstance(validated_at, bool)
+                and isinstance(config, dict)
+                and time.time() - validated_at < _CACHE_TTL
+            ):
+                return config
+
+        # Drop corrupt, mismatched or expired entries so they don't linger
+        self._remove_cache_file(cache_file)
+        return None
+
+    def _write_cache(self, cache_key: Dict[str, Any], config: Dict[str, Any]) -> None:
+        """Store a validated config in the cache, ignoring any write failure."""
+        entry = {"key": cache_key, "validated_at": time.time(), "config": config}
+        cache_file = self._cache_file(cache_key)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            # Configs holding non-JSON values (e.g. dates) are not cached
+            payload = json.dumps(entry)
+            if json.loads(payload) != entry:
+                return
+            # The config may hold secrets such as hf_token, so keep it owner-only
+            os.makedirs(_CACHE_DIR, mode=0o700, exist_ok=True)
+            os.chmod(_CACHE_DIR, 0o700)
+            self._prune_cache()
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as file:
+                file.write(payload)
+            os.replace(tmp_file, cache_file)
+        except (OSError, TypeError, ValueError):
+            self._remove_cache_file(tmp_file)
+
+    def _prune_cache(self) -> None:
+        """Delete cache files that are older than the cache TTL."""
+        cutoff = time.time() - _CACHE_TTL
+        for name in os.listdir(_CACHE_DIR):
+            path = os.path.join(_CACHE_DIR, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _remove_cache_file(path: str) -> None:
+        """Delete a cache file, ignoring errors."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
     def _validate_section_exists(self, config: Dict[str, Any], section: str) -> None:
         """Validate that a section exists in the config."""
         if section not in config:
@@ -85,11 +345,12 @@ class ConfigReader:
         self, section: Dict[str, Any], field: str, section_name: str
     ) -> None:
         """Validate that a field exists in a section and has a non-empty value."""
-        if field not in section or section[field] is None:
+        value = section.get(field, _MISSING)
+        if value is _MISSING or value is None:
             raise click.ClickException(
                 f"Missing required field '{field}' in {section_name} section"
             )
-        if isinstance(section[field], str) and not section[field].strip():
+        if isinstance(value, str) and not value.strip():
             raise click.ClickException(
                 f"Empty value for required field '{field}' in {section_name} section"
             )
@@ -104,18 +365,20 @@ class ConfigReader:
 
         self._validate_field_exists_and_non_empty(api_section, "address", "api")
 
-        url = f"http://{api_section['address']}"
-        if api_section["port"]:
-            url += f":{api_section['port']}"
-        url += "/health"
+    def _check_api_health(self, config: Dict[str, Any]) -> None:
+        """Check that the API server health endpoint is reachable."""
+        import requests
+
+        url = self._build_api_base_url(config["api"]) + "/health"
 
         try:
-            response = requests.get(url)
+            response = _cached_request("HEAD", url, timeout=_API_HEALTH_TIMEOUT)
+            if response.status_code == 405:
+                # Server doesn't support HEAD on this endpoint
+                response = _cached_request("GET", url, timeout=_API_HEALTH_TIMEOUT)
             if response.status_code != 200:
-                pass
                 raise click.ClickException(f"Status code is {response.status_code}")
         except requests.RequestException as e:
-            pass
             raise click.ClickException(f"API Health Check failed: {e}")
 
     def _validate_env_section(self, config: Dict[str, Any]) -> None:
@@ -126,24 +389,11 @@ class ConfigReader:
         if not isinstance(envs_section, dict):
             raise click.ClickException("Resources section must be a dictionary")
 
-        required_fields = ["VLLM_USE_TRITON_FLASH_ATTN", "VLLM_ROCM_USE_AITER"]
-        for field in required_fields:
+        for field in _REQUIRED_ENV_FIELDS:
             self._validate_field_exists_and_non_empty(envs_section, field, "envs")
 
         # Validate types of environment variables if they exist
-        valid_types = {
-            "VLLM_ROCM_USE_AITER_LINEAR": bool,
-            "VLLM_ROCM_USE_AITER_MOE": bool,
-            "VLLM_ROCM_USE_AITER_FP8_BLOCK_SCALED_MOE": bool,
-            "VLLM_ROCM_USE_AITER_RMSNORM": bool,
-            "VLLM_WORKER_MULTIPROC_METHOD": str,
-            "VLLM_IMAGE_FETCH_TIMEOUT": int,
-            "VLLM_VIDEO_FETCH_TIMEOUT": int,
-            "VLLM_AUDIO_FETCH_TIMEOUT": int,
-            "VLLM_RPC_TIMEOUT": int,
-        }
-
-        for key, expected_type in valid_types.items():
+        for key, expected_type in _VALID_ENV_TYPES.items():
             if key in envs_section and not isinstance(envs_section[key], expected_type):
                 raise click.ClickException(
                     f"Invalid type for {key} in env section. Expected {expected_type.__name__}"
@@ -159,10 +409,18 @@ class ConfigReader:
 
         self._validate_field_exists_and_non_empty(model_section, "model_name", "model")
 
+    def _check_model_exists(self, config: Dict[str, Any]) -> None:
+        """Check that the model exists on the Hugging Face Hub."""
+        import requests
+
+        model_section = config["model"]
         url = f"https://huggingface.co/{model_section['model_name']}"
 
         try:
-            response = requests.get(url)
+            # HEAD is enough to check existence without downloading the page
+            response = _cached_request(
+                "HEAD", url, allow_redirects=True, timeout=_HTTP_TIMEOUT
+            )
             if response.status_code != 200:
                 raise requests.RequestException(
                     f"Resource not found! Sorry, we can't find the model '{model_section['model_name']}' you are looking for."
@@ -178,23 +436,20 @@ class ConfigReader:
         if not isinstance(resources_section, dict):
             raise click.ClickException("Resources section must be a dictionary")
 
-        required_fields = ["cpus", "memory", "ports", "accelerators", "image_id"]
-        for field in required_fields:
+        for field in _REQUIRED_RESOURCES_FIELDS:
             self._validate_field_exists_and_non_empty(
                 resources_section, field, "resources"
             )
 
         self._validate_docker_image(resources_section["image_id"])
 
-        try:
-            _, number = resources_section["accelerators"].split(":")
-            int(number)
-        except ValueError as e:
+        accelerators = resources_section["accelerators"]
+        if not isinstance(accelerators, str) or not _ACCELERATORS_RE.fullmatch(
+            accelerators
+        ):
             raise click.ClickException(
                 "Number of accelerators must be an integer & Accelerator field should be in the format of e.g. MI200:2"
-            ) from e
-        except Exception as e:
-            raise click.ClickException(f"Error validating resources field: {e}")
+            )
 
     def _validate_service_section(self, config: Dict[str, Any]) -> None:
         """Validate the Service section of the configuration."""
@@ -204,13 +459,14 @@ class ConfigReader:
         if not isinstance(service_section, dict):
             raise click.ClickException("Service section must be a dictionary")
 
-        required_fields = ["ports", "readiness_probe"]
-        for field in required_fields:
+        for field in _REQUIRED_SERVICE_FIELDS:
             self._validate_field_exists_and_non_empty(service_section, field, "service")
 
-        if service_section["ports"] != config["resources"]["ports"]:
+        svc_ports = service_section["ports"]
+        res_ports = config["resources"]["ports"]
+        if svc_ports != res_ports:
             raise click.ClickException(
-                f"Service port doesn't not match Resources port value: {service_section['ports']}:{config['resources']['ports']}"
+                f"Service port doesn't not match Resources port value: {svc_ports}:{res_ports}"
             )
 
     def _validate_docker_image(self, image_id: str) -> None:
@@ -253,6 +509,26 @@ class ConfigReader:
         self._validate_resources_section(config)
         self._validate_service_section(config)
 
+        # Remote checks are independent, so run them concurrently
+        probes = [self._check_api_health, self._check_model_exists]
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = [executor.submit(probe, config) for probe in probes]
+            for future in as_completed(futures):
+                future.result()
+
+    @staticmethod
+    def _build_api_base_url(api_section: Dict[str, Any]) -> str:
+        """Build the API server base URL from the API section."""
+        url = f"http://{api_section['address']}"
+        if api_section.get("port"):
+            url += f":{api_section['port']}"
+        return url
+
+    @functools.cached_property
+    def api_base_url(self) -> str:
+        """Get the API server base URL."""
+        return self._build_api_base_url(self.config["api"])
+
     @property
     def api_config(self) -> APIConfig:
         """Get API configuration."""
@@ -327,10 +603,17 @@ def cli():
     required=True,
     help="Path to YAML configuration file",
 )
-def validate(file):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore cached validation results and re-validate the configuration",
+)
+def validate(file, no_cache):
     """Validate the configuration file."""
     try:
-        config_reader = ConfigReader(file)
+        config_reader = ConfigReader(file, use_cache=not no_cache)
+        config_reader.validate()
 
         # API Configuration
         api = config_reader.api_config
@@ -380,6 +663,8 @@ def validate(file):
         click.echo(f"  Readiness Probe: {svc.readiness_probe}")
 
         click.echo("\n\nConfiguration is valid!")
+        if config_reader.from_cache:
+            click.echo(_CACHED_VALIDATION_NOTE)
     except click.ClickException as e:
         click.echo(f"Configuration error: {e}", err=True)
         raise click.Abort()
@@ -393,26 +678,59 @@ def validate(file):
     required=True,
     help="Path to YAML configuration file",
 )
-def deploy(file):
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Ignore cached validation results and re-validate the configuration",
+)
+@click.option(
+    "--skip-validate",
+    is_flag=True,
+    default=False,
+    help="Send the configuration without validating it first",
+)
+def deploy(file, no_cache, skip_validate):
     """Send the configuration to the API server."""
+    import requests
+
     try:
-        config_reader = ConfigReader(file)
+        config_reader = ConfigReader(file, use_cache=not no_cache)
+        if not skip_validate:
+            config_reader.validate()
+            if config_reader.from_cache:
+                click.echo(_CACHED_VALIDATION_NOTE)
+        else:
+            # The API section is still needed to build the deploy URL
+            config_reader._validate_api_section(config_reader.config)
         # Convert the configuration to a JSON-compatible dictionary
         config_data = config_reader.config
 
-        api_url = f"http://{config_reader.config['api']['address']}"
-        if config_reader.config["api"]["port"]:
-            api_url += f":{config_reader.config['api']['port']}"
-        api_url += "/deploy"
+        api_url = config_reader.api_base_url + "/deploy"
+
+        try:
+            body = _json_dumps(config_data)
+        except (TypeError, ValueError) as e:
+            raise click.ClickException(f"Configuration cannot be sent as JSON: {e}")
 
         # Send the configuration to the API server
-        response = requests.post(api_url, json=config_data)
+        response = _get_session().post(
+            api_url,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            timeout=_DEPLOY_TIMEOUT,
+        )
 
         # Check the response status
         if response.status_code == 200:
+            try:
+                result = _json_loads(response.content)
+            except ValueError as e:
+                raise click.ClickException(
+                    f"Invalid JSON response from the API server: {e}"
+                )
             click.echo(
-                "Configuration successfully sent to the API server.\n"
-                + str(response.json())
+                "Configuration successfully sent to the API server.\n" + str(result)
             )
         else:
             click.echo(
@@ -10,6 +10,10 @@ setup(
         "requests>=2.32.0",
         "click>=8.0.0",  # Example if using Click
     ],
+    extras_require={
+        # Faster JSON encoding/decoding for deploy requests
+        "fast": ["orjson>=3.6.0"],
+    },
     entry_points={
         "console_scripts": [
             "mipod-cli=mipod_cli.main:cli",